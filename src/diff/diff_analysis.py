@@ -3,6 +3,8 @@ import logging
 
 from .diff_extractor import DiffExtractor, MiniDiff
 from ..semantic_ast.ast_file_analysis import ast_based_expand_context, SemanticAST
+from ..semantic_ast.ast_change_classifier import classify_hunk_changes, ChangeKind
+from ..semantic_ast.ast_skeleton import render_skeleton, RenderBudget
 
 logging.basicConfig(level=logging.DEBUG,
                     format='%(asctime)s - %(levelname)s - %(message)s')
@@ -15,36 +17,108 @@ class KudoDiff:
     diff_content: str
     old_content: str
     semantic_ast: SemanticAST = None
+    hunk_changes: List[ChangeKind] = None
+    rendered_context: str = None
 
     def __init__(self, mini_diff: MiniDiff):
         self.change_type = mini_diff.change_type
         self.old_path = mini_diff.old_path
         self.new_path = mini_diff.new_path
         self.diff_content = mini_diff.diff_content
+        self.hunk_changes = None
+        self.rendered_context = None
+
+    def _all_hunks_in(self, kinds: List[ChangeKind]) -> bool:
+        if not self.hunk_changes:
+            return False
+        return all(kind in kinds for kind in self.hunk_changes)
+
+    @property
+    def is_no_op(self) -> bool:
+        return self._all_hunks_in([ChangeKind.NO_OP])
+
+    @property
+    def is_formatting_only(self) -> bool:
+        return self._all_hunks_in([ChangeKind.NO_OP, ChangeKind.FORMATTING_ONLY])
 
     def __str__(self):
         return f"Diff (change_type={self.change_type}, old_path={self.old_path}, new_path={self.new_path}, \n Diffs = \n {self.diff_content})"
 
-    def get_source_code_context(self) -> str:
+    def _source_code_header(self) -> str:
         if self.old_path is not None:
-            source = f"=== {self.old_path} === \n"
-        else:
-            source = f"=== Add new file {self.new_path} === \n"
+            return f"=== {self.old_path} === \n"
+        return f"=== Add new file {self.new_path} === \n"
+
+    def get_fixed_prompt_text(self) -> str:
+        '''
+        Parts of the prompt for this file that are never shortened: the file header and the diff
+        '''
+        return self._source_code_header() + self.diff_content
+
+    def get_source_code_context(self) -> str:
+        source = self._source_code_header()
 
+        if self.rendered_context is not None:
+            return source + self.rendered_context
         if self.semantic_ast is None:
             return source + self.old_content
         else:
             return source + self.semantic_ast.stringify()
 
+    def render_source_code_context(self, skeleton: bool = False, surrounding_lines: int = 3,
+                                   budget: RenderBudget = None) -> str:
+        '''
+        Render the source code context (without the file header) within the budget and cache it
+        '''
+        if self.semantic_ast is None:
+            context = self.old_content
+        elif skeleton:
+            context = render_skeleton(self.semantic_ast, surrounding_lines, budget)
+        else:
+            context = self.semantic_ast.stringify()
+
+        if budget is not None:
+            context = budget.truncate(context)
+        self.rendered_context = context
+        return context
+
 
 class DiffAnalyzer:
     _repo_path: str
     raw_diffs: List[MiniDiff]
     kudo_diffs: List[KudoDiff]
-
-    def __init__(self, repo_path: str):
+    skipped_diffs: List[KudoDiff]
+    skip_formatting_only: bool
+    skeleton: bool
+    surrounding_lines: int
+    file_budget: RenderBudget
+    pr_budget: RenderBudget
+
+    def __init__(self, repo_path: str, skip_formatting_only: bool = False, skeleton: bool = False,
+                 surrounding_lines: int = 3, file_budget: RenderBudget = None,
+                 pr_budget: RenderBudget = None):
         self._repo_path = repo_path
         self.kudo_diffs = []
+        self.skipped_diffs = []
+        self.skip_formatting_only = skip_formatting_only
+        self.skeleton = skeleton
+        self.surrounding_lines = surrounding_lines
+        self.file_budget = file_budget
+        self.pr_budget = pr_budget
+
+    def _classify_changes(self, mini_diff: MiniDiff) -> List[ChangeKind]:
+        hunk_lines = [
+            ([line - 1 for line in hunk.old_changed_lines],
+             [line - 1 for line in hunk.new_changed_lines])
+            for hunk in mini_diff.diff_hunks
+        ]
+        return classify_hunk_changes(
+            mini_diff.new_path, mini_diff.old_content, mini_diff.new_content, hunk_lines)
+
+    def _should_skip(self, file_diff: KudoDiff) -> bool:
+        if self.skip_formatting_only:
+            return file_diff.is_formatting_only
+        return file_diff.is_no_op
 
     def _expand_context(self, mini_diffs: List[MiniDiff]):
         for mini_diff in mini_diffs:
@@ -55,13 +129,18 @@ class DiffAnalyzer:
 
             file_diff = KudoDiff(mini_diff=mini_diff)
             if not (mini_diff.old_path is None or mini_diff.new_path is None):
+                file_diff.hunk_changes = self._classify_changes(mini_diff)
                 semantic_ast = ast_based_expand_context(
                     mini_diff.old_path, mini_diff.old_content, lines)
                 file_diff.semantic_ast = semantic_ast
             if file_diff.semantic_ast is None:
                 file_diff.old_content = mini_diff.old_content
 
-            self.kudo_diffs.append(file_diff)
+            if self._should_skip(file_diff):
+                logging.info(f"Skip review of {file_diff.new_path}: no semantic change")
+                self.skipped_diffs.append(file_diff)
+            else:
+                self.kudo_diffs.append(file_diff)
 
     def analyze_diffs(self, target_branch: str, base_branch: str) -> List[KudoDiff]:
         # Extract diffs
@@ -69,8 +148,37 @@ class DiffAnalyzer:
         self.mini_diffs = diff_extractor.extract_diffs(target_branch, base_branch)
         # Expand source code context
         self._expand_context(self.mini_diffs)
+        # Render source code context within budgets
+        self._render_context(self.kudo_diffs)
+        # Skipped diffs never reach the prompt, only render them unbudgeted to measure the savings
+        for kudo_diff in self.skipped_diffs:
+            kudo_diff.render_source_code_context(self.skeleton, self.surrounding_lines)
         return self.kudo_diffs
 
+    def _render_context(self, kudo_diffs: List[KudoDiff]):
+        '''
+        Budgets cover the whole per-file prompt text: file headers, diffs and source context.
+        Headers and diffs are never shortened, so they are paid first and the source context
+        gets what is left. Each file gets at most its file budget and a fair share of what is
+        left of the PR budget, so files rendered smaller than their share leave more room for
+        the next ones
+        '''
+        remaining = self.pr_budget
+        if remaining is not None:
+            for kudo_diff in kudo_diffs:
+                remaining = remaining.consume(kudo_diff.get_fixed_prompt_text())
+
+        for i, kudo_diff in enumerate(kudo_diffs):
+            budget = self.file_budget
+            if budget is not None:
+                budget = budget.consume(kudo_diff.get_fixed_prompt_text())
+            if remaining is not None:
+                budget = remaining.share(len(kudo_diffs) - i).tighten(budget)
+            context = kudo_diff.render_source_code_context(
+                self.skeleton, self.surrounding_lines, budget)
+            if remaining is not None:
+                remaining = remaining.consume(context)
+
     def get_source_code_context(self) -> str:
         return "".join(
             diff.get_source_code_context()
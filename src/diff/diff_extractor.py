@@ -14,6 +14,12 @@ class MiniDiffHunk:
     new_start_line: int
     new_end_line: int
     hunk_content: str
+    old_changed_lines: List[int]
+    new_changed_lines: List[int]
+
+    def __init__(self):
+        self.old_changed_lines = []
+        self.new_changed_lines = []
 
 
 class MiniDiff:
@@ -23,6 +29,7 @@ class MiniDiff:
     diff_hunks: List[MiniDiffHunk]
     diff_content: str
     old_content: str
+    new_content: str
 
     def __init__(self):
         self.diff_hunks = []
@@ -31,6 +38,7 @@ class MiniDiff:
         self.new_path = None
         self.diff_content = ""
         self.old_content = ""
+        self.new_content = ""
 
     def __str__(self):
         return f"DIFF from {self.old_path} to {self.new_path}:\n{self.diff_content}"
@@ -85,6 +93,22 @@ class DiffExtractor:
                 # Slice the hunk content
                 hunk.hunk_content = content[start_index:end_index].strip()
 
+                # Track the removed/added lines, excluding context lines
+                old_line = hunk.old_start_line
+                new_line = hunk.new_start_line
+                for line in hunk.hunk_content.splitlines()[1:]:
+                    if line.startswith("-"):
+                        hunk.old_changed_lines.append(old_line)
+                        old_line += 1
+                    elif line.startswith("+"):
+                        hunk.new_changed_lines.append(new_line)
+                        new_line += 1
+                    elif line.startswith("\\"):
+                        continue
+                    else:
+                        old_line += 1
+                        new_line += 1
+
                 diff.diff_hunks.append(hunk)
 
     def extract_diffs(self, target_branch: str, base_branch: str) -> List[MiniDiff]:
@@ -120,6 +144,8 @@ class DiffExtractor:
 
             blob = merge_base.tree[diff.a_path] if diff.a_path else None
             mini_diff.old_content = blob.data_stream.read().decode("utf-8") if blob else ""
+            new_blob = diff.b_blob
+            mini_diff.new_content = new_blob.data_stream.read().decode("utf-8") if new_blob else ""
 
             self._diffs.append(mini_diff)
 
@@ -1,8 +1,19 @@
 from .llm_review import review_file, LLMReviewer
 from .light_review.diff_review import DiffLightReviewer
+from .fake_llm import FakeLLMClient, FakeLLMError, LatencyDistribution, LatencyKind
+from .load_harness import LoadHarness, LoadReport, ReviewJob, PRReviewJob, FileReviewJob
 
 __all__ = [
     "review_file",
     'LLMReviewer',
     'DiffLightReviewer',
+    'FakeLLMClient',
+    'FakeLLMError',
+    'LatencyDistribution',
+    'LatencyKind',
+    'LoadHarness',
+    'LoadReport',
+    'ReviewJob',
+    'PRReviewJob',
+    'FileReviewJob',
 ]
\ No newline at end of file
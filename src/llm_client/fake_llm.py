@@ -0,0 +1,243 @@
+import json
+import random
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Deque
+
+from .utils import estimate_tokens
+
+'''
+A local stand-in for genai.Client, used to measure review throughput without hitting Gemini.
+FakeLLMClient exposes the same `client.models.generate_content(model=..., contents=...)` surface,
+so it can be plugged into LLMReviewer (client=...) and raw_llm_review (set_client / llm_client=...).
+'''
+
+DEFAULT_RESPONSE = json.dumps({
+    "state": "STOP",
+    "confidence": 1.0,
+    "request_review_funcs": [],
+    "quick_review": [],
+    "summary": {
+        "overall_assessment": "No issues found.",
+        "confidence": "high",
+    },
+    "bugs": [],
+    "risks": [],
+    "suggestions": [],
+}, indent=2)
+
+
+class LatencyKind(Enum):
+    CONSTANT = "constant"
+    UNIFORM = "uniform"
+    NORMAL = "normal"
+    LOGNORMAL = "lognormal"
+    EXPONENTIAL = "exponential"
+
+
+class LatencyDistribution:
+    '''
+    Latency in seconds drawn from a distribution.
+    - CONSTANT: always `mean`
+    - UNIFORM: between `low` and `high`
+    - NORMAL: gaussian(`mean`, `stddev`), clipped at 0
+    - LOGNORMAL: lognormvariate(`mu`, `sigma`), heavy tail similar to real LLM APIs
+    - EXPONENTIAL: expovariate(1 / `mean`)
+    '''
+    kind: LatencyKind
+
+    def __init__(self, kind: LatencyKind = LatencyKind.CONSTANT, mean: float = 0.0,
+                 stddev: float = 0.0, low: float = 0.0, high: float = 0.0,
+                 mu: float = 0.0, sigma: float = 0.0):
+        self.kind = kind
+        self.mean = mean
+        self.stddev = stddev
+        self.low = low
+        self.high = high
+        self.mu = mu
+        self.sigma = sigma
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == LatencyKind.CONSTANT:
+            value = self.mean
+        elif self.kind == LatencyKind.UNIFORM:
+            value = rng.uniform(self.low, self.high)
+        elif self.kind == LatencyKind.NORMAL:
+            value = rng.gauss(self.mean, self.stddev)
+        elif self.kind == LatencyKind.LOGNORMAL:
+            value = rng.lognormvariate(self.mu, self.sigma)
+        elif self.kind == LatencyKind.EXPONENTIAL:
+            value = rng.expovariate(1.0 / self.mean) if self.mean > 0 else 0.0
+        else:
+            raise ValueError(f"Unsupported latency kind {self.kind}")
+        return max(0.0, value)
+
+
+class FakeLLMError(Exception):
+    '''
+    Error raised by the fake backend. Carries an HTTP-like `code` like google.genai's APIError,
+    so retry logic can treat both the same way.
+    '''
+    code: int
+
+    def __init__(self, code: int, message: str):
+        super().__init__(f"{code} {message}")
+        self.code = code
+        self.message = message
+
+
+class FakeUsageMetadata:
+    prompt_token_count: int
+    candidates_token_count: int
+    total_token_count: int
+
+    def __init__(self, prompt_token_count: int, candidates_token_count: int):
+        self.prompt_token_count = prompt_token_count
+        self.candidates_token_count = candidates_token_count
+        self.total_token_count = prompt_token_count + candidates_token_count
+
+
+class FakeResponse:
+    text: str
+    usage_metadata: FakeUsageMetadata
+
+    def __init__(self, text: str, usage_metadata: FakeUsageMetadata):
+        self.text = text
+        self.usage_metadata = usage_metadata
+
+
+class FakeLLMStats:
+    '''
+    Counters shared across all threads calling one FakeLLMClient.
+    Token counts only cover successful responses, prompts of rejected requests (429/5xx)
+    are tracked separately in `rejected_prompt_tokens`.
+    '''
+
+    def __init__(self):
+        self.requests = 0
+        self.successes = 0
+        self.rate_limited = 0
+        self.errors = 0
+        self.partial_responses = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.rejected_prompt_tokens = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "successes": self.successes,
+            "rate_limited": self.rate_limited,
+            "errors": self.errors,
+            "partial_responses": self.partial_responses,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "rejected_prompt_tokens": self.rejected_prompt_tokens,
+        }
+
+
+class _FakeModels:
+    def __init__(self, client: "FakeLLMClient"):
+        self._client = client
+
+    def generate_content(self, model: str, contents, **kwargs) -> FakeResponse:
+        return self._client.generate_content(model, contents)
+
+
+class FakeLLMClient:
+    '''
+    Thread-safe fake LLM backend.
+
+    Faults are injected per request, in this order:
+    1. Quota: more than `max_requests_per_second` requests in the last second -> 429
+    2. `rate_limit_rate` probability of a random 429
+    3. `error_rate` probability of a 500/503
+    4. `partial_rate` probability of a truncated response body
+    Every request (including failed ones) waits for a sampled latency plus
+    `per_token_latency` seconds per completion token.
+    '''
+    latency: LatencyDistribution
+    responder: Callable[[str], str]
+    stats: FakeLLMStats
+
+    def __init__(self, latency: LatencyDistribution = None,
+                 responder: Callable[[str], str] = None,
+                 per_token_latency: float = 0.0,
+                 rate_limit_rate: float = 0.0,
+                 error_rate: float = 0.0,
+                 partial_rate: float = 0.0,
+                 max_requests_per_second: float = None,
+                 seed: int = None):
+        self.latency = latency if latency is not None else LatencyDistribution()
+        self.responder = responder if responder is not None else (lambda prompt: DEFAULT_RESPONSE)
+        self.per_token_latency = per_token_latency
+        self.rate_limit_rate = rate_limit_rate
+        self.error_rate = error_rate
+        self.partial_rate = partial_rate
+        self.max_requests_per_second = max_requests_per_second
+        self.stats = FakeLLMStats()
+        self.models = _FakeModels(self)
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._request_times: Deque[float] = deque()
+
+    def _over_quota(self, now: float) -> bool:
+        if self.max_requests_per_second is None:
+            return False
+        while self._request_times and now - self._request_times[0] >= 1.0:
+            self._request_times.popleft()
+        if len(self._request_times) >= self.max_requests_per_second:
+            return True
+        self._request_times.append(now)
+        return False
+
+    def generate_content(self, model: str, contents) -> FakeResponse:
+        prompt = contents if isinstance(contents, str) else str(contents)
+        prompt_tokens = estimate_tokens(prompt)
+
+        with self._lock:
+            self.stats.requests += 1
+            over_quota = self._over_quota(time.monotonic())
+            roll_rate_limit = self._rng.random()
+            roll_error = self._rng.random()
+            roll_partial = self._rng.random()
+            error_code = self._rng.choice([500, 503])
+            delay = self.latency.sample(self._rng)
+
+        if over_quota or roll_rate_limit < self.rate_limit_rate:
+            time.sleep(delay)
+            with self._lock:
+                self.stats.rate_limited += 1
+                self.stats.rejected_prompt_tokens += prompt_tokens
+            raise FakeLLMError(429, "RESOURCE_EXHAUSTED: rate limit exceeded")
+
+        if roll_error < self.error_rate:
+            time.sleep(delay)
+            with self._lock:
+                self.stats.errors += 1
+                self.stats.rejected_prompt_tokens += prompt_tokens
+            raise FakeLLMError(error_code, "INTERNAL: injected server error")
+
+        text = self.responder(prompt)
+        if roll_partial < self.partial_rate:
+            text = text[:len(text) // 2]
+        completion_tokens = estimate_tokens(text)
+
+        time.sleep(delay + self.per_token_latency * completion_tokens)
+
+        with self._lock:
+            self.stats.successes += 1
+            self.stats.prompt_tokens += prompt_tokens
+            self.stats.completion_tokens += completion_tokens
+            if roll_partial < self.partial_rate:
+                self.stats.partial_responses += 1
+
+        return FakeResponse(text, FakeUsageMetadata(prompt_tokens, completion_tokens))
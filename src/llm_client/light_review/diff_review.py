@@ -1,12 +1,18 @@
+import logging
 from typing import List
 
 from ..llm_review import LLMReviewer
+from ..utils import estimate_tokens
 from ...diff.diff_analysis import DiffAnalyzer, KudoDiff
+from ...semantic_ast.ast_skeleton import RenderBudget
 
 
 class DiffLightReviewer(LLMReviewer):
     kudo_diffs: List[KudoDiff]
+    skipped_diffs: List[KudoDiff]
     source_code_context: str
+    saved_tokens: int = 0
+    skeleton: bool
     response_scheme = """
 {
     "state": "STOP | CONTINUE",
@@ -29,18 +35,62 @@ class DiffLightReviewer(LLMReviewer):
     }
 """
 
-    def __init__(self, api_key_var, model_name, repo_path, base_branch, target_branch):
-        super().__init__(api_key_var, model_name)
-        diff_analyzer = DiffAnalyzer(repo_path=repo_path)
+    def __init__(self, api_key_var, model_name, repo_path, base_branch, target_branch, client=None,
+                 skip_formatting_only=False, skeleton=False, surrounding_lines=3,
+                 file_token_budget=None, pr_token_budget=None):
+        super().__init__(api_key_var, model_name, client)
+        self.skeleton = skeleton
+        diff_analyzer = DiffAnalyzer(
+            repo_path=repo_path,
+            skip_formatting_only=skip_formatting_only,
+            skeleton=skeleton,
+            surrounding_lines=surrounding_lines,
+            file_budget=self._token_budget(file_token_budget),
+            pr_budget=self._token_budget(pr_token_budget),
+        )
         self.kudo_diffs = diff_analyzer.analyze_diffs(
             target_branch=target_branch, base_branch=base_branch)
+        self.skipped_diffs = diff_analyzer.skipped_diffs
         self.source_code_context = diff_analyzer.get_source_code_context()
 
+    def _token_budget(self, max_tokens) -> RenderBudget:
+        if max_tokens is None:
+            return None
+        return RenderBudget(max_tokens=max_tokens, token_counter=estimate_tokens)
+
+    def _render_only_diff_block(self, i: int, kd: KudoDiff) -> str:
+        return f"--- Diff {i+1} ---\n{kd.diff_content}"
+
+    def _render_diff_with_source_block(self, i: int, kd: KudoDiff) -> str:
+        return f"""
+    --- Diff {i+1} ---
+    {kd.diff_content}
+
+    Relevant source context:
+    {kd.get_source_code_context()}
+    """
+
+    def _count_saved_tokens(self, render_block) -> int:
+        '''
+        Estimate the prompt tokens saved by dropping the skipped (no-op) diffs.
+        Skipped diffs are measured at their unbudgeted size, i.e. what they would add to the prompt
+        without file/PR token budgets, so this is an upper bound when budgets are set
+        '''
+        saved_tokens = sum(
+            estimate_tokens(render_block(i, kd))
+            for i, kd in enumerate(self.skipped_diffs)
+        )
+        if self.skipped_diffs:
+            logging.info(
+                f"Dropped {len(self.skipped_diffs)} no-op files from prompt, saved ~{saved_tokens} tokens")
+        return saved_tokens
+
     def _generate_only_diff_prompt(self) -> str:
         diffs = "\n\n".join(
-            f"--- Diff {i+1} ---\n{kd.diff_content}"
+            self._render_only_diff_block(i, kd)
             for i, kd in enumerate(self.kudo_diffs)
         )
+        self.saved_tokens = self._count_saved_tokens(self._render_only_diff_block)
 
         return f"""
     You are a senior software engineer performing a lightweight code review.
@@ -69,24 +119,25 @@ class DiffLightReviewer(LLMReviewer):
         blocks = []
 
         for i, kd in enumerate(self.kudo_diffs):
-            blocks.append(
-                f"""
-    --- Diff {i+1} ---
-    {kd.diff_content}
-
-    Relevant source context:
-    {kd.get_source_code_context()}
-    """
-            )
+            blocks.append(self._render_diff_with_source_block(i, kd))
 
         all_blocks = "\n".join(blocks)
+        self.saved_tokens = self._count_saved_tokens(self._render_diff_with_source_block)
+
+        if self.skeleton:
+            context_description = "Partial source code context rendered as a skeleton via tree-sitter: " \
+                "signatures, class headers and docstring first lines of enclosing definitions, " \
+                "plus the lines around each change"
+        else:
+            context_description = "Partial source code context patched via tree-sitter, " \
+                "so you might see some parts like <Node ...>"
 
         return f"""
     You are a senior software engineer reviewing code changes.
 
     You are provided with:
     1. Git diffs
-    2. Partial source code context patched via tree-sitter, so you might see some parts like <Node ...>
+    2. {context_description}
 
     Your tasks:
     1. Decide whether this change needs deeper review.
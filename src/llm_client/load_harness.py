@@ -0,0 +1,193 @@
+import math
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from .raw_llm_review import raw_review_file
+from .utils import extract_json
+
+'''
+Load harness that drives many concurrent reviews end to end against a pluggable client
+(usually a FakeLLMClient) and reports throughput, latency percentiles and retry counts.
+'''
+
+RETRYABLE_CODES = [429, 500, 502, 503, 504]
+
+
+class ReviewJob(ABC):
+    '''
+    One end-to-end review. `prepare` runs once (e.g. diff analysis),
+    `execute` is the LLM call and is retried by the harness.
+    '''
+    name: str
+
+    def prepare(self, client) -> None:
+        pass
+
+    @abstractmethod
+    def execute(self, client) -> str:
+        pass
+
+
+class PRReviewJob(ReviewJob):
+    def __init__(self, repo_path: str, base_branch: str, target_branch: str,
+                 model_name: str = "gemini-2.5-flash", skip_formatting_only: bool = False,
+                 skeleton: bool = False, surrounding_lines: int = 3,
+                 file_token_budget: int = None, pr_token_budget: int = None):
+        self.name = f"{repo_path}:{base_branch}..{target_branch}"
+        self.repo_path = repo_path
+        self.base_branch = base_branch
+        self.target_branch = target_branch
+        self.model_name = model_name
+        self.skip_formatting_only = skip_formatting_only
+        self.skeleton = skeleton
+        self.surrounding_lines = surrounding_lines
+        self.file_token_budget = file_token_budget
+        self.pr_token_budget = pr_token_budget
+        self._reviewer = None
+
+    def prepare(self, client) -> None:
+        from .light_review.diff_review import DiffLightReviewer
+        self._reviewer = DiffLightReviewer(
+            api_key_var=None,
+            model_name=self.model_name,
+            repo_path=self.repo_path,
+            base_branch=self.base_branch,
+            target_branch=self.target_branch,
+            client=client,
+            skip_formatting_only=self.skip_formatting_only,
+            skeleton=self.skeleton,
+            surrounding_lines=self.surrounding_lines,
+            file_token_budget=self.file_token_budget,
+            pr_token_budget=self.pr_token_budget,
+        )
+
+    def execute(self, client) -> str:
+        return self._reviewer.llm_review()
+
+
+class FileReviewJob(ReviewJob):
+    def __init__(self, file_path: str):
+        self.name = file_path
+        self.file_path = file_path
+
+    def execute(self, client) -> str:
+        return raw_review_file(self.file_path, client)
+
+
+class JobResult:
+    name: str
+    success: bool
+    latency: float
+    retries: int
+    error: str
+
+    def __init__(self, name: str, success: bool, latency: float, retries: int, error: str = None):
+        self.name = name
+        self.success = success
+        self.latency = latency
+        self.retries = retries
+        self.error = error
+
+
+def percentile(values: List[float], pct: float) -> float:
+    '''
+    Nearest-rank percentile, `pct` in range (0-100]
+    '''
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class LoadReport:
+    results: List[JobResult]
+    wall_time: float
+    client_stats: dict
+
+    def __init__(self, results: List[JobResult], wall_time: float, client_stats: dict = None):
+        self.results = results
+        self.wall_time = wall_time
+        self.client_stats = client_stats
+
+    def to_dict(self) -> dict:
+        latencies = [r.latency for r in self.results if r.success]
+        succeeded = len(latencies)
+        report = {
+            "jobs": len(self.results),
+            "succeeded": succeeded,
+            "failed": len(self.results) - succeeded,
+            "wall_time_s": self.wall_time,
+            "throughput_rps": succeeded / self.wall_time if self.wall_time > 0 else 0.0,
+            "latency_p50_s": percentile(latencies, 50),
+            "latency_p95_s": percentile(latencies, 95),
+            "latency_p99_s": percentile(latencies, 99),
+            "retries": sum(r.retries for r in self.results),
+        }
+        if self.client_stats is not None:
+            report["client"] = self.client_stats
+        return report
+
+    def __str__(self):
+        report = self.to_dict()
+        lines = [
+            f"Jobs: {report['jobs']} (succeeded={report['succeeded']}, failed={report['failed']})",
+            f"Wall time: {report['wall_time_s']:.3f}s, throughput: {report['throughput_rps']:.2f} reviews/s",
+            f"Latency p50={report['latency_p50_s']:.3f}s p95={report['latency_p95_s']:.3f}s "
+            f"p99={report['latency_p99_s']:.3f}s",
+            f"Retries: {report['retries']}",
+        ]
+        if self.client_stats is not None:
+            lines.append(f"Client: {self.client_stats}")
+        return "\n".join(lines)
+
+
+class LoadHarness:
+    '''
+    Runs ReviewJobs on a thread pool. A failed LLM call is retried with exponential backoff when
+    it carries a retryable `code` (429/5xx) or returns a response without valid JSON.
+    '''
+
+    def __init__(self, client, concurrency: int = 8, max_retries: int = 3,
+                 backoff: float = 0.5, max_backoff: float = 8.0):
+        self.client = client
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+    def _is_retryable(self, error: Exception) -> bool:
+        if isinstance(error, ValueError):
+            # Partial / malformed response rejected by extract_json
+            return True
+        return getattr(error, "code", None) in RETRYABLE_CODES
+
+    def _run_job(self, job: ReviewJob) -> JobResult:
+        start = time.perf_counter()
+        retries = 0
+        try:
+            job.prepare(self.client)
+        except Exception as e:
+            return JobResult(job.name, False, time.perf_counter() - start, retries, repr(e))
+
+        while True:
+            try:
+                extract_json(job.execute(self.client))
+                return JobResult(job.name, True, time.perf_counter() - start, retries)
+            except Exception as e:
+                if retries >= self.max_retries or not self._is_retryable(e):
+                    return JobResult(job.name, False, time.perf_counter() - start, retries, repr(e))
+                time.sleep(min(self.max_backoff, self.backoff * (2 ** retries)))
+                retries += 1
+
+    def run(self, jobs: List[ReviewJob]) -> LoadReport:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            results = list(executor.map(self._run_job, jobs))
+        wall_time = time.perf_counter() - start
+
+        stats = getattr(self.client, "stats", None)
+        client_stats = stats.to_dict() if stats is not None else None
+        return LoadReport(results, wall_time, client_stats)
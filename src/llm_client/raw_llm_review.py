@@ -4,12 +4,30 @@ from dotenv import load_dotenv
 from google import genai
 
 
-load_dotenv()
-api_key = os.getenv("GOOGLE_API_KEY")
-if not api_key:
-    raise RuntimeError("GOOGLE_API_KEY environment variable is not set")
-client = genai.Client(api_key=api_key)
 model_name = "gemini-2.5-flash"
+client = None
+
+
+def get_client():
+    '''
+    Lazily create the default Gemini client, so a fake backend can be plugged in without an API key
+    '''
+    global client
+    if client is None:
+        load_dotenv()
+        api_key = os.getenv("GOOGLE_API_KEY")
+        if not api_key:
+            raise RuntimeError("GOOGLE_API_KEY environment variable is not set")
+        client = genai.Client(api_key=api_key)
+    return client
+
+
+def set_client(new_client):
+    '''
+    Replace the default client, e.g. with a FakeLLMClient for local load testing
+    '''
+    global client
+    client = new_client
 
 
 def generate_question(code: str) -> str:
@@ -69,21 +87,23 @@ def generate_question(code: str) -> str:
     return prompt
 
 
-def generate_answer(prompt: str) -> str:
-    response = client.models.generate_content(
+def generate_answer(prompt: str, llm_client=None) -> str:
+    if llm_client is None:
+        llm_client = get_client()
+    response = llm_client.models.generate_content(
         model=model_name,
         contents=prompt,
     )
     return response.text
 
 
-def review_code(code: str) -> str:
+def review_code(code: str, llm_client=None) -> str:
     prompt = generate_question(code)
-    answer = generate_answer(prompt)
+    answer = generate_answer(prompt, llm_client)
     return answer
 
 
-def raw_review_file(file_path: str) -> str:
+def raw_review_file(file_path: str, llm_client=None) -> str:
     with open(file_path, 'r', encoding='utf-8') as file:
         code = file.read()
-    return review_code(code)
\ No newline at end of file
+    return review_code(code, llm_client)
\ No newline at end of file
@@ -13,4 +13,13 @@ def extract_json(text: str) -> dict:
     try:
         return json.loads(match.group())
     except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in LLM output: {e}") from e
\ No newline at end of file
+        raise ValueError(f"Invalid JSON in LLM output: {e}") from e
+
+
+def estimate_tokens(text: str) -> int:
+    '''
+    Rough token estimate (~4 characters per token), good enough for relative accounting
+    '''
+    if not text:
+        return 0
+    return max(1, len(text) // 4)
\ No newline at end of file
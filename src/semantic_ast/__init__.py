@@ -1,6 +1,12 @@
 from .ast_file_analysis import ast_based_expand_context, SemanticAST
+from .ast_change_classifier import classify_hunk_changes, ChangeKind
+from .ast_skeleton import render_skeleton, RenderBudget
 
 __all__ = [
     'SemanticAST',
     'ast_based_expand_context',
+    'ChangeKind',
+    'classify_hunk_changes',
+    'RenderBudget',
+    'render_skeleton',
 ]
\ No newline at end of file
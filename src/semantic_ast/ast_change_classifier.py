@@ -0,0 +1,208 @@
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import List, Tuple
+from tree_sitter_languages import get_parser
+from tree_sitter import Tree, Node
+
+from .lang_utils import detect_language, SupportedLang
+
+'''
+Classify each diff hunk by comparing normalized syntax trees of the old and new blobs.
+- NO_OP: the syntax trees are identical once comments are ignored (whitespace, blank lines, comments)
+- FORMATTING_ONLY: identical after formatter normalization (quotes, trailing commas, parentheses, import order)
+- SEMANTIC: anything else, including files that do not parse cleanly
+'''
+
+
+class ChangeKind(Enum):
+    NO_OP = "no_op"
+    FORMATTING_ONLY = "formatting_only"
+    SEMANTIC = "semantic"
+
+
+class SemanticChangeClassifier(ABC):
+    old_tree: Tree
+    new_tree: Tree
+    comment_types: List[str] = ["comment"]
+    statement_container_types: List[str] = []
+
+    def __init__(self, old_tree: Tree, new_tree: Tree):
+        super().__init__()
+        self.old_tree = old_tree
+        self.new_tree = new_tree
+
+    def _collect_leaves_at_lines(self, node: Node, lines: set, leaves: List[Node]):
+        if not any(node.start_point[0] <= line <= node.end_point[0] for line in lines):
+            return
+        if node.type in self.comment_types:
+            return
+        if node.child_count == 0:
+            leaves.append(node)
+            return
+        for child in node.children:
+            self._collect_leaves_at_lines(child, lines, leaves)
+
+    def _enclosing_statement(self, node: Node) -> Node:
+        while node.parent is not None and node.parent.type not in self.statement_container_types:
+            node = node.parent
+        return node
+
+    def _find_statements_at_lines(self, tree: Tree, lines: List[int]) -> List[Node]:
+        '''
+        Find the outermost-deduplicated statements touched by the given (0-based) lines
+        '''
+        leaves: List[Node] = []
+        self._collect_leaves_at_lines(tree.root_node, set(lines), leaves)
+
+        statements = {}
+        for leaf in leaves:
+            statement = self._enclosing_statement(leaf)
+            statements[(statement.start_byte, statement.end_byte)] = statement
+
+        result: List[Node] = []
+        for key in sorted(statements, key=lambda k: (k[0], -k[1])):
+            if result and result[-1].start_byte <= key[0] and key[1] <= result[-1].end_byte:
+                continue
+            result.append(statements[key])
+        return result
+
+    def _serialize(self, node: Node, normalize: bool):
+        if node.type in self.comment_types:
+            return None
+        if normalize:
+            normalized = self._normalize_node(node)
+            if normalized is not None:
+                return normalized
+        if node.child_count == 0:
+            return (node.type, node.text)
+        children = (self._serialize(child, normalize) for child in node.children)
+        return (node.type, tuple(child for child in children if child is not None))
+
+    @abstractmethod
+    def _normalize_node(self, node: Node):
+        '''
+        Return a formatter-independent serialization of the node, or None to use the default one
+        '''
+        pass
+
+    def _normalize_statements(self, statements: List[tuple]) -> List[tuple]:
+        return statements
+
+    def _serialize_statements(self, nodes: List[Node], normalize: bool) -> List[tuple]:
+        statements = [self._serialize(node, normalize) for node in nodes]
+        statements = [statement for statement in statements if statement is not None]
+        if normalize:
+            statements = self._normalize_statements(statements)
+        return statements
+
+    def _containers(self, node: Node) -> List[Node]:
+        '''
+        Statement containers enclosing the node, innermost first
+        '''
+        containers = []
+        node = node.parent
+        while node is not None:
+            if node.type in self.statement_container_types:
+                containers.append(node)
+            node = node.parent
+        return containers
+
+    def _container_path(self, container: Node) -> tuple:
+        '''
+        Types (and names, e.g. of functions) of the container and its ancestors, so moving code
+        between scopes or nesting levels is never considered equivalent
+        '''
+        path = []
+        node = container
+        while node is not None:
+            name = node.child_by_field_name("name")
+            path.append((node.type, name.text if name is not None else None))
+            node = node.parent
+        return tuple(path)
+
+    def _serialize_hunk_region(self, tree: Tree, lines: List[int], normalize: bool) -> tuple:
+        '''
+        Serialize the touched statements in place: the path of their smallest common container,
+        plus the slice of its statements from the sibling before the first touched statement
+        to the sibling after the last one, with markers at the container boundaries.
+        This keeps sibling order and nesting in the comparison.
+        '''
+        statements = self._find_statements_at_lines(tree, lines)
+        if not statements:
+            return ()
+
+        def _key(node: Node) -> tuple:
+            return (node.type, node.start_byte, node.end_byte)
+
+        common = [_key(node) for node in self._containers(statements[0])]
+        for statement in statements[1:]:
+            keys = set(_key(node) for node in self._containers(statement))
+            common = [key for key in common if key in keys]
+        if not common:
+            return (tuple(self._serialize_statements(statements, normalize)),)
+        container = next(node for node in self._containers(statements[0]) if _key(node) == common[0])
+
+        siblings = [child for child in container.named_children if child.type not in self.comment_types]
+        indices = [
+            i for i, sibling in enumerate(siblings)
+            if any(sibling.start_byte <= statement.start_byte and statement.end_byte <= sibling.end_byte
+                   for statement in statements)
+        ]
+        first, last = self._expand_touched_range(siblings, indices[0], indices[-1])
+        low = max(0, first - 1)
+        high = min(len(siblings), last + 2)
+
+        region = [("<start>",)] if low == 0 else []
+        region.extend(self._serialize_statements(siblings[low:high], normalize))
+        if high == len(siblings):
+            region.append(("<end>",))
+        return (self._container_path(container), tuple(region))
+
+    def _expand_touched_range(self, siblings: List[Node], first: int, last: int) -> Tuple[int, int]:
+        '''
+        Widen the touched sibling range, e.g. over statements that may be reordered freely
+        '''
+        return first, last
+
+    def classify_hunk(self, old_lines: List[int], new_lines: List[int]) -> ChangeKind:
+        if self.old_tree.root_node.has_error or self.new_tree.root_node.has_error:
+            return ChangeKind.SEMANTIC
+
+        for normalize, kind in [(False, ChangeKind.NO_OP), (True, ChangeKind.FORMATTING_ONLY)]:
+            old_region = self._serialize_hunk_region(self.old_tree, old_lines, normalize)
+            new_region = self._serialize_hunk_region(self.new_tree, new_lines, normalize)
+            if old_region == new_region:
+                return kind
+        return ChangeKind.SEMANTIC
+
+
+def get_change_classifier(path: str, old_content: str, new_content: str) -> SemanticChangeClassifier:
+    '''
+    Get the appropriate SemanticChangeClassifier based on the programming language.
+    '''
+    language = detect_language(path)
+
+    if language == SupportedLang.PYTHON:
+        parser = get_parser(SupportedLang.PYTHON.value)
+        old_tree = parser.parse(old_content.encode('utf-8'))
+        new_tree = parser.parse(new_content.encode('utf-8'))
+
+        from .ast_python import PythonChangeClassifier
+        return PythonChangeClassifier(old_tree, new_tree)
+    # Add more languages as needed
+    else:
+        raise NotImplementedError(
+            f"Change classifier for {path} with language '{language.value}' is not implemented.")
+
+
+def classify_hunk_changes(path: str, old_content: str, new_content: str,
+                          hunk_lines: List[Tuple[List[int], List[int]]]) -> List[ChangeKind]:
+    '''
+    Classify each hunk given as (old changed lines, new changed lines), 0-based.
+    Return None if the language is not supported.
+    '''
+    lang = detect_language(path)
+    if lang == SupportedLang.UNKNOWN:
+        return None
+    classifier = get_change_classifier(path, old_content, new_content)
+    return [classifier.classify_hunk(old_lines, new_lines) for old_lines, new_lines in hunk_lines]
@@ -47,9 +47,13 @@ class SemanticASTNode:
 class SemanticAST:
     path: str
     root: SemanticASTNode = None
+    source: str = ""
+    request_lines: List[int | tuple] = []
 
-    def __init__(self, path: str):
+    def __init__(self, path: str, source: str = ""):
         self.path = path
+        self.source = source
+        self.request_lines = []
 
     def stringify(self):
         if self.root is None:
@@ -63,7 +67,7 @@ class SourceCodeContextExpander(ABC):
 
     def __init__(self, path, tree):
         super().__init__()
-        self.semantic_ast = SemanticAST(path)
+        self.semantic_ast = SemanticAST(path, tree.text.decode("utf-8", errors="replace"))
         self.ast = tree
 
     def _find_path_to_deepest_node_at_line(self, node: Node, line: int) -> List[Node]:
@@ -144,6 +148,7 @@ class SourceCodeContextExpander(ABC):
                 raise ValueError(f"Unsupported request value {type(request)}")
 
         self._construct_semantic_ast(expr_paths)
+        self.semantic_ast.request_lines.extend(request_lines)
         return self.semantic_ast
 
 
@@ -1,8 +1,11 @@
+import ast
 from enum import Enum
 from typing import List
 from tree_sitter import Node
 
 from .ast_file_analysis import SourceCodeContextExpander
+from .ast_change_classifier import SemanticChangeClassifier
+from .ast_skeleton import SkeletonRenderer
 
 
 class PythonMeaningfulAST(Enum):
@@ -10,6 +13,7 @@ class PythonMeaningfulAST(Enum):
     CLASS_DEF = "class_definition"
     DECORATED_DEF = "decorated_definition"
     MODULE = "module"
+    BLOCK = "block"
 
 
 MEANINGFUL_AST_TYPES = [
@@ -18,6 +22,38 @@ MEANINGFUL_AST_TYPES = [
     PythonMeaningfulAST.FUNC_DEF.value,
 ]
 
+IMPORT_AST_TYPES = [
+    "import_statement",
+    "import_from_statement",
+    "future_import_statement",
+]
+
+CLOSING_BRACKETS = [")", "]", "}"]
+
+# Statements (and their clauses) whose header ends with a colon before a nested block
+COMPOUND_AST_TYPES = [
+    "if_statement",
+    "elif_clause",
+    "else_clause",
+    "for_statement",
+    "while_statement",
+    "with_statement",
+    "try_statement",
+    "except_clause",
+    "except_group_clause",
+    "finally_clause",
+    "match_statement",
+    "case_clause",
+]
+
+# A trailing comma changes the meaning of `(a,)`, `x[a,]` and `case (a,):`,
+# so only drop it when another comma exists
+TRAILING_COMMA_SENSITIVE_TYPES = [
+    "tuple",
+    "subscript",
+    "tuple_pattern",
+]
+
 
 class PythonSourceContextExpander(SourceCodeContextExpander):
     def _refactor_semantic_path(self, node_path: List[Node]) -> List[Node]:
@@ -36,3 +72,147 @@ class PythonSourceContextExpander(SourceCodeContextExpander):
                 node_path = node_path[0:2]
         
         return self._refactor_semantic_path(node_path)
+
+
+class PythonChangeClassifier(SemanticChangeClassifier):
+    statement_container_types = [
+        PythonMeaningfulAST.MODULE.value,
+        PythonMeaningfulAST.BLOCK.value,
+    ]
+
+    def _normalize_string(self, node: Node):
+        # f-strings cannot be evaluated statically
+        if any(child.type == "interpolation" for child in node.children):
+            return None
+        try:
+            value = ast.literal_eval(node.text.decode("utf-8"))
+        except (ValueError, SyntaxError, UnicodeDecodeError):
+            return None
+        return (node.type, repr(value))
+
+    def _normalize_import(self, node: Node):
+        module = node.child_by_field_name("module_name")
+        names = sorted(
+            b" ".join(child.text.split())
+            for child in node.named_children
+            if child.type not in self.comment_types
+            and (module is None or child.start_byte != module.start_byte)
+        )
+        module_name = module.text if module is not None else None
+        return (node.type, module_name, tuple(names))
+
+    def _normalize_trailing_comma(self, node: Node):
+        children = [child for child in node.children if child.type not in self.comment_types]
+        if len(children) < 2 or children[-1].type not in CLOSING_BRACKETS or children[-2].type != ",":
+            return None
+        if node.type in TRAILING_COMMA_SENSITIVE_TYPES and sum(child.type == "," for child in children) < 2:
+            return None
+        serialized = (self._serialize(child, True) for child in children[:-2] + children[-1:])
+        return (node.type, tuple(serialized))
+
+    def _normalize_node(self, node: Node):
+        if node.type == "parenthesized_expression":
+            inner = [child for child in node.named_children if child.type not in self.comment_types]
+            if len(inner) == 1:
+                return self._serialize(inner[0], True)
+        if node.type == "string":
+            return self._normalize_string(node)
+        if node.type in IMPORT_AST_TYPES:
+            return self._normalize_import(node)
+        return self._normalize_trailing_comma(node)
+
+    def _expand_touched_range(self, siblings: List[Node], first: int, last: int):
+        # Cover whole runs of imports, so reordering them compares the same statements
+        while first > 0 and siblings[first].type in IMPORT_AST_TYPES \
+                and siblings[first - 1].type in IMPORT_AST_TYPES:
+            first -= 1
+        while last < len(siblings) - 1 and siblings[last].type in IMPORT_AST_TYPES \
+                and siblings[last + 1].type in IMPORT_AST_TYPES:
+            last += 1
+        return first, last
+
+    def _bound_names(self, statement: tuple) -> List[bytes]:
+        '''
+        Names bound by a normalized import statement, `*` binds unknown names
+        '''
+        node_type, _, names = statement
+        bound = []
+        for name in names:
+            if b" as " in name:
+                bound.append(name.rsplit(b" as ", 1)[1])
+            elif node_type == "import_statement":
+                bound.append(name.split(b".", 1)[0])
+            else:
+                bound.append(name)
+        return bound
+
+    def _sort_imports(self, imports: List[tuple]) -> List[tuple]:
+        # Reordering only keeps the meaning when no name is bound twice (shadowing) in the run
+        bound = [name for statement in imports for name in self._bound_names(statement)]
+        if b"*" in bound or len(bound) != len(set(bound)):
+            return imports
+        return sorted(imports)
+
+    def _normalize_statements(self, statements: List[tuple]) -> List[tuple]:
+        # Consecutive imports may be reordered freely (e.g. by isort)
+        result: List[tuple] = []
+        imports: List[tuple] = []
+        for statement in statements:
+            if statement[0] in IMPORT_AST_TYPES:
+                imports.append(statement)
+                continue
+            result.extend(self._sort_imports(imports))
+            imports = []
+            result.append(statement)
+        result.extend(self._sort_imports(imports))
+        return result
+
+
+class PythonSkeletonRenderer(SkeletonRenderer):
+    def _is_definition(self, node: Node) -> bool:
+        return node.type in MEANINGFUL_AST_TYPES
+
+    def _is_compound_statement(self, node: Node) -> bool:
+        return node.type in COMPOUND_AST_TYPES
+
+    def _definition(self, node: Node) -> Node:
+        if node.type == PythonMeaningfulAST.DECORATED_DEF.value:
+            return node.child_by_field_name("definition")
+        if node.type in [PythonMeaningfulAST.FUNC_DEF.value, PythonMeaningfulAST.CLASS_DEF.value]:
+            return node
+        return None
+
+    def _header_lines(self, node: Node) -> List[int]:
+        start = node.start_point[0]
+        header = self._definition(node)
+        if header is None and self._is_compound_statement(node):
+            header = node
+        if header is None:
+            return [start]
+
+        # The header ends at the colon before the body, which may share its line
+        colons = [child for child in header.children if child.type == ":"]
+        end = colons[0].start_point[0] if colons else header.start_point[0]
+        return list(range(start, end + 1))
+
+    def _docstring_lines(self, node: Node) -> List[int]:
+        definition = self._definition(node)
+        if definition is None:
+            return []
+        body = definition.child_by_field_name("body")
+        if body is None:
+            return []
+
+        statements = [child for child in body.named_children if child.type != "comment"]
+        if not statements or statements[0].type != "expression_statement":
+            return []
+        string = statements[0].named_children[0] if statements[0].named_children else None
+        if string is None or string.type != "string":
+            return []
+
+        start = string.start_point[0]
+        first_line = string.text.split(b"\n", 1)[0].strip()
+        # Opening quotes alone on their line, also show the summary line below
+        if first_line.strip(b"rRbBuUfF\"'") == b"" and string.end_point[0] > start:
+            return [start, start + 1]
+        return [start]
@@ -0,0 +1,256 @@
+from abc import ABC, abstractmethod
+from typing import Callable, List, Set, Tuple
+from tree_sitter import Node
+
+from .ast_file_analysis import SemanticAST, SemanticASTNode
+from .lang_utils import detect_language, SupportedLang
+
+'''
+Render a SemanticAST as a skeleton instead of raw <Node ...> placeholders:
+- Ancestors are rendered as their real headers (signatures, class headers) and the first docstring line
+- Source code context nodes keep their header, the headers of enclosing definitions and control flow
+  statements, and only the lines around the requested hunks
+- Omitted lines are replaced by "....." at the indentation of the omitted code
+When a RenderBudget is given, the rendering degrades until it fits:
+surrounding lines -> no surrounding lines -> headers only -> truncated.
+'''
+
+ELISION_MARKER = "....."
+
+
+class RenderBudget:
+    '''
+    Byte and/or token limit for rendered prompt text, None means unlimited.
+    `token_counter` is required when `max_tokens` is set.
+    '''
+    max_bytes: int
+    max_tokens: int
+    token_counter: Callable[[str], int]
+
+    def __init__(self, max_bytes: int = None, max_tokens: int = None,
+                 token_counter: Callable[[str], int] = None):
+        if max_tokens is not None and token_counter is None:
+            raise ValueError("token_counter is required when max_tokens is set")
+        self.max_bytes = max_bytes
+        self.max_tokens = max_tokens
+        self.token_counter = token_counter
+
+    def fits(self, text: str) -> bool:
+        if self.max_bytes is not None and len(text.encode("utf-8")) > self.max_bytes:
+            return False
+        if self.max_tokens is not None and self.token_counter(text) > self.max_tokens:
+            return False
+        return True
+
+    def share(self, parts: int) -> "RenderBudget":
+        '''
+        Split the budget evenly across `parts` consumers
+        '''
+        parts = max(1, parts)
+        return RenderBudget(
+            max_bytes=self.max_bytes // parts if self.max_bytes is not None else None,
+            max_tokens=self.max_tokens // parts if self.max_tokens is not None else None,
+            token_counter=self.token_counter,
+        )
+
+    def consume(self, text: str) -> "RenderBudget":
+        '''
+        Budget left after spending it on `text`
+        '''
+        max_bytes = self.max_bytes
+        if max_bytes is not None:
+            max_bytes = max(0, max_bytes - len(text.encode("utf-8")))
+        max_tokens = self.max_tokens
+        if max_tokens is not None:
+            max_tokens = max(0, max_tokens - self.token_counter(text))
+        return RenderBudget(max_bytes, max_tokens, self.token_counter)
+
+    def tighten(self, other: "RenderBudget") -> "RenderBudget":
+        '''
+        The stricter of the two budgets, limit by limit
+        '''
+        if other is None:
+            return self
+
+        def _min(a, b):
+            if a is None:
+                return b
+            if b is None:
+                return a
+            return min(a, b)
+
+        return RenderBudget(
+            max_bytes=_min(self.max_bytes, other.max_bytes),
+            max_tokens=_min(self.max_tokens, other.max_tokens),
+            token_counter=self.token_counter or other.token_counter,
+        )
+
+    def truncate(self, text: str) -> str:
+        '''
+        Keep as many leading lines as fit in the budget, followed by an elision marker
+        '''
+        if self.fits(text):
+            return text
+        lines = text.split("\n")
+
+        def _candidate(count: int) -> str:
+            return "\n".join(lines[:count] + [ELISION_MARKER])
+
+        low, high = 0, len(lines)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if self.fits(_candidate(mid)):
+                low = mid
+            else:
+                high = mid - 1
+
+        if low == 0 and not self.fits(ELISION_MARKER):
+            return ""
+        return _candidate(low)
+
+
+class SkeletonRenderer(ABC):
+    surrounding_lines: int
+
+    def __init__(self, surrounding_lines: int = 3):
+        super().__init__()
+        self.surrounding_lines = surrounding_lines
+
+    @abstractmethod
+    def _is_definition(self, node: Node) -> bool:
+        pass
+
+    @abstractmethod
+    def _is_compound_statement(self, node: Node) -> bool:
+        '''
+        Control flow statements and clauses with a header, e.g. `if`, `for`, `else`
+        '''
+        pass
+
+    @abstractmethod
+    def _header_lines(self, node: Node) -> List[int]:
+        '''
+        Lines of the node header, e.g. decorators and signature of a function, or an `if` condition
+        '''
+        pass
+
+    @abstractmethod
+    def _docstring_lines(self, node: Node) -> List[int]:
+        '''
+        Lines needed to show the first line of the node docstring, empty if there is none
+        '''
+        pass
+
+    def _focus_ranges(self, semantic_ast: SemanticAST) -> List[Tuple[int, int]]:
+        ranges = []
+        for request in semantic_ast.request_lines:
+            if isinstance(request, int):
+                ranges.append((request, request))
+            else:
+                ranges.append((request[0], request[1]))
+        return ranges
+
+    def _collect_enclosing_headers(self, node: Node, focus_start: int, focus_end: int, lines: Set[int]):
+        '''
+        Keep headers of the definitions and compound statements nested in a context node
+        that enclose the focus range, so the change is shown under its scope and conditions
+        '''
+        if node.end_point[0] < focus_start or node.start_point[0] > focus_end:
+            return
+        if self._is_definition(node):
+            lines.update(self._header_lines(node))
+            lines.update(self._docstring_lines(node))
+        elif self._is_compound_statement(node):
+            lines.update(self._header_lines(node))
+        for child in node.named_children:
+            self._collect_enclosing_headers(child, focus_start, focus_end, lines)
+
+    def _collect_lines(self, node: SemanticASTNode, focus_ranges: List[Tuple[int, int]],
+                       surrounding_lines: int, lines: Set[int]):
+        ast_node = node.ast_node
+        if node.parent is not None and self._is_definition(ast_node):
+            lines.update(self._header_lines(ast_node))
+            lines.update(self._docstring_lines(ast_node))
+
+        if node.is_source_code_context:
+            start, end = ast_node.start_point[0], ast_node.end_point[0]
+            for focus_start, focus_end in focus_ranges:
+                if focus_end < start or focus_start > end:
+                    continue
+                self._collect_enclosing_headers(ast_node, focus_start, focus_end, lines)
+                if surrounding_lines is not None:
+                    lo = max(start, focus_start - surrounding_lines)
+                    hi = min(end, focus_end + surrounding_lines)
+                    lines.update(range(lo, hi + 1))
+
+        for child in node.children:
+            self._collect_lines(child, focus_ranges, surrounding_lines, lines)
+
+    def _render_lines(self, source_lines: List[str], lines: Set[int]) -> str:
+        rendered: List[str] = []
+        previous = -1
+        for line in sorted(lines):
+            if line >= len(source_lines):
+                continue
+            if line > previous + 1:
+                rendered.extend(self._elision(source_lines[previous + 1:line]))
+            rendered.append(source_lines[line])
+            previous = line
+        rendered.extend(self._elision(source_lines[previous + 1:]))
+        return "\n".join(rendered)
+
+    def _elision(self, omitted_lines: List[str]) -> List[str]:
+        '''
+        A single marker at the indentation of the first omitted line of code, none for blank lines
+        '''
+        for line in omitted_lines:
+            if line.strip():
+                indent = line[:len(line) - len(line.lstrip())]
+                return [indent + ELISION_MARKER]
+        return []
+
+    def _render(self, semantic_ast: SemanticAST, surrounding_lines: int) -> str:
+        '''
+        Render the skeleton, `surrounding_lines=None` renders headers only
+        '''
+        lines: Set[int] = set()
+        self._collect_lines(semantic_ast.root, self._focus_ranges(semantic_ast),
+                            surrounding_lines, lines)
+        return self._render_lines(semantic_ast.source.split("\n"), lines)
+
+    def render(self, semantic_ast: SemanticAST, budget: RenderBudget = None) -> str:
+        if semantic_ast.root is None:
+            return ""
+
+        levels = [self.surrounding_lines]
+        if self.surrounding_lines > 0:
+            levels.append(0)
+        levels.append(None)
+
+        text = ""
+        for surrounding_lines in levels:
+            text = self._render(semantic_ast, surrounding_lines)
+            if budget is None or budget.fits(text):
+                return text
+        return budget.truncate(text)
+
+
+def get_skeleton_renderer(path: str, surrounding_lines: int = 3) -> SkeletonRenderer:
+    '''
+    Get the appropriate SkeletonRenderer based on the programming language.
+    '''
+    language = detect_language(path)
+
+    if language == SupportedLang.PYTHON:
+        from .ast_python import PythonSkeletonRenderer
+        return PythonSkeletonRenderer(surrounding_lines)
+    # Add more languages as needed
+    else:
+        raise NotImplementedError(
+            f"Skeleton renderer for {path} with language '{language.value}' is not implemented.")
+
+
+def render_skeleton(semantic_ast: SemanticAST, surrounding_lines: int = 3,
+                    budget: RenderBudget = None) -> str:
+    renderer = get_skeleton_renderer(semantic_ast.path, surrounding_lines)
+    return renderer.render(semantic_ast, budget)
@@ -0,0 +1,27 @@
+import pytest
+from git import Repo
+
+
+def _commit(repo: Repo, files: dict, message: str):
+    for name, content in files.items():
+        with open(f"{repo.working_tree_dir}/{name}", "w", encoding="utf-8") as file:
+            file.write(content)
+    repo.index.add(list(files))
+    repo.index.commit(message)
+
+
+@pytest.fixture
+def git_pr(tmp_path):
+    '''
+    Build a scratch repo for a pull request: `base` holds `base_files`, `feature` adds
+    `changed_files` on top of it. Returns the repo path.
+    '''
+    def _git_pr(base_files: dict, changed_files: dict) -> str:
+        repo = Repo.init(tmp_path)
+        _commit(repo, base_files, "base")
+        repo.create_head("base")
+        repo.create_head("feature").checkout()
+        _commit(repo, changed_files, "change")
+        return str(tmp_path)
+
+    return _git_pr
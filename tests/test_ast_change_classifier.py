@@ -0,0 +1,126 @@
+import difflib
+
+from src.diff.diff_analysis import DiffAnalyzer
+from src.semantic_ast import classify_hunk_changes, ChangeKind
+
+
+def classify(old: str, new: str):
+    '''
+    Classify `old` -> `new` with hunks grouped like `git diff` (3 context lines), 0-based changed lines
+    '''
+    old_lines = old.splitlines()
+    new_lines = new.splitlines()
+    matcher = difflib.SequenceMatcher(a=old_lines, b=new_lines, autojunk=False)
+
+    hunk_lines = []
+    for group in matcher.get_grouped_opcodes(3):
+        old_changed, new_changed = [], []
+        for tag, i1, i2, j1, j2 in group:
+            if tag != "equal":
+                old_changed.extend(range(i1, i2))
+                new_changed.extend(range(j1, j2))
+        hunk_lines.append((old_changed, new_changed))
+    return classify_hunk_changes("a.py", old, new, hunk_lines)
+
+
+BASE = '''import os
+import sys
+
+
+def f(a, b):
+    # compute
+    x = a + b
+    return x
+'''
+
+
+def test_reordered_calls_are_semantic():
+    old = "def g():\n    a()\n    b()\n    c()\n"
+    new = "def g():\n    b()\n    c()\n    a()\n"
+    assert classify(old, new) == [ChangeKind.SEMANTIC]
+
+
+def test_dedent_out_of_if_is_semantic():
+    old = "if x:\n    y = 1\n    z = 2\n"
+    new = "if x:\n    y = 1\nz = 2\n"
+    assert classify(old, new) == [ChangeKind.SEMANTIC]
+
+
+def test_move_into_function_is_semantic():
+    old = "x = 1\n\n\ndef f():\n    pass\n"
+    new = "\n\ndef f():\n    x = 1\n    pass\n"
+    assert classify(old, new) == [ChangeKind.SEMANTIC]
+
+
+def test_expression_change_is_semantic():
+    assert classify(BASE, BASE.replace("a + b", "a - b")) == [ChangeKind.SEMANTIC]
+
+
+def test_comment_only_is_no_op():
+    assert classify(BASE, BASE.replace("# compute", "# add both")) == [ChangeKind.NO_OP]
+    assert classify(BASE, BASE.replace("    x = a", "    # new comment\n    x = a")) == [ChangeKind.NO_OP]
+    assert classify(BASE, BASE.replace("a + b\n", "a + b  # sum\n")) == [ChangeKind.NO_OP]
+
+
+def test_blank_lines_are_no_op():
+    assert classify(BASE, BASE.replace("\n\n\ndef", "\n\n\n\ndef")) == [ChangeKind.NO_OP]
+
+
+def test_quote_style_is_formatting_only():
+    old = BASE.replace("return x", "return 'x'")
+    new = BASE.replace("return x", 'return "x"')
+    assert classify(old, new) == [ChangeKind.FORMATTING_ONLY]
+
+
+def test_trailing_comma_is_formatting_only():
+    new = BASE.replace("def f(a, b):", "def f(\n    a,\n    b,\n):")
+    assert classify(BASE, new) == [ChangeKind.FORMATTING_ONLY]
+
+
+def test_single_element_tuple_comma_is_semantic():
+    old = BASE.replace("return x", "return (x,)")
+    new = BASE.replace("return x", "return (x)")
+    assert classify(old, new) == [ChangeKind.SEMANTIC]
+
+
+def test_single_element_tuple_pattern_comma_is_semantic():
+    match = "match v:\n    case {}:\n        pass\n"
+    assert classify(match.format("(a,)"), match.format("(a)")) == [ChangeKind.SEMANTIC]
+    assert classify(match.format("[a,]"), match.format("[a]")) == [ChangeKind.FORMATTING_ONLY]
+
+
+def test_redundant_parentheses_are_formatting_only():
+    assert classify(BASE, BASE.replace("x = a + b", "x = (a + b)")) == [ChangeKind.FORMATTING_ONLY]
+    assert classify(BASE, BASE.replace("x = a + b", "x = (a + b) * 2")) == [ChangeKind.SEMANTIC]
+
+
+def test_import_reorder_is_formatting_only():
+    new = BASE.replace("import os\nimport sys", "import sys\nimport os")
+    assert classify(BASE, new) == [ChangeKind.FORMATTING_ONLY]
+
+
+def test_import_reorder_with_shadowing_is_semantic():
+    old = "from a import x\nfrom b import x\n\nprint(x)\n"
+    new = "from b import x\nfrom a import x\n\nprint(x)\n"
+    assert classify(old, new) == [ChangeKind.SEMANTIC]
+
+    old = "import a.b\nimport c as a\n"
+    new = "import c as a\nimport a.b\n"
+    assert classify(old, new) == [ChangeKind.SEMANTIC]
+
+
+def test_diff_analyzer_never_skips_semantic_files(git_pr):
+    repo_path = git_pr({
+        "logic.py": "def g(x):\n    if x:\n        step1()\n        step2()\n    a()\n    b()\n",
+        "notes.py": "def h():\n    # old\n    return 1\n",
+    }, {
+        "logic.py": "def g(x):\n    if x:\n        step1()\n    step2()\n    b()\n    a()\n",
+        "notes.py": "def h():\n    # new\n    return 1\n",
+    })
+
+    analyzer = DiffAnalyzer(repo_path)
+    kudo_diffs = analyzer.analyze_diffs("feature", "base")
+
+    assert [kd.new_path for kd in kudo_diffs] == ["logic.py"]
+    assert all(kind == ChangeKind.SEMANTIC for kind in kudo_diffs[0].hunk_changes)
+    assert [kd.new_path for kd in analyzer.skipped_diffs] == ["notes.py"]
@@ -0,0 +1,71 @@
+from src.diff.diff_analysis import DiffAnalyzer
+from src.semantic_ast import ast_based_expand_context, render_skeleton, RenderBudget
+
+
+def skeleton(content: str, line: int, surrounding_lines: int = 0) -> str:
+    semantic_ast = ast_based_expand_context("a.py", content, [(line, line)])
+    return render_skeleton(semantic_ast, surrounding_lines)
+
+
+def test_block_first_statement_is_not_a_header():
+    content = "class K:\n    x = 1\n\n    def m(self):\n        a = 1\n        return a\n"
+    rendered = skeleton(content, 4)
+    assert "class K:" in rendered
+    assert "def m(self):" in rendered
+    assert "x = 1" not in rendered
+
+
+def test_multi_line_signature_with_body_on_same_line():
+    content = "import os\n\n\ndef h(a,\n      b): return a\n"
+    rendered = skeleton(content, 3)
+    assert "def h(a,\n      b): return a" in rendered
+
+
+def test_docstring_first_line_is_kept():
+    body = "".join(f"    v{i} = {i}\n" for i in range(50))
+    content = f'def f():\n    """Summary line.\n\n    Details.\n    """\n{body}'
+    rendered = skeleton(content, 30)
+    assert '    """Summary line.' in rendered
+    assert "Details." not in rendered
+    assert "v25 = 25" in rendered
+    assert "v10 = 10" not in rendered
+
+
+def test_enclosing_control_flow_headers_are_kept():
+    body = "".join(f"            w{i} = {i}\n" for i in range(30))
+    content = (
+        "def f(items):\n    total = 0\n    for it in items:\n        if it.ok:\n"
+        f"{body}        else:\n            pass\n    return total\n"
+    )
+    rendered = skeleton(content, 20)
+    assert "    for it in items:" in rendered
+    assert "        if it.ok:" in rendered
+    assert "w16 = 16" in rendered
+    assert "else:" not in rendered
+    assert "w5 = 5" not in rendered
+
+
+def test_pr_budget_covers_headers_and_diffs(git_pr):
+    files = {
+        f"m{n}.py": "def f():\n" + "".join(f"    v{i} = {i}\n" for i in range(100))
+        for n in range(3)
+    }
+    repo_path = git_pr(files, {name: content.replace("v50 = 50", "v50 = -50") for name, content in files.items()})
+
+    max_bytes = 900
+    analyzer = DiffAnalyzer(repo_path, skeleton=True, pr_budget=RenderBudget(max_bytes=max_bytes))
+    kudo_diffs = analyzer.analyze_diffs("feature", "base")
+
+    prompt_text = "".join(kd.diff_content + kd.get_source_code_context() for kd in kudo_diffs)
+    assert len(prompt_text.encode("utf-8")) <= max_bytes
+
+
+def test_skipped_diffs_are_rendered_unbudgeted(git_pr):
+    content = "def f():\n" + "".join(f"    v{i} = {i}  # note {i}\n" for i in range(100))
+    repo_path = git_pr({"m.py": content}, {"m.py": content.replace("# note 50", "# changed")})
+
+    analyzer = DiffAnalyzer(repo_path, skeleton=True, pr_budget=RenderBudget(max_bytes=300))
+    assert analyzer.analyze_diffs("feature", "base") == []
+
+    skipped = analyzer.skipped_diffs[0]
+    assert skipped.rendered_context == render_skeleton(skipped.semantic_ast, 3)
@@ -0,0 +1,57 @@
+import pytest
+
+from src.llm_client import FakeLLMClient, FakeLLMError, LatencyDistribution, LatencyKind
+from src.llm_client.utils import estimate_tokens
+
+
+def outcomes(client: FakeLLMClient, prompts: int) -> list:
+    result = []
+    for i in range(prompts):
+        try:
+            result.append(client.models.generate_content(model="fake", contents=f"prompt {i}").text)
+        except FakeLLMError as e:
+            result.append(e.code)
+    return result
+
+
+def test_seeded_client_is_deterministic():
+    def _client():
+        return FakeLLMClient(
+            latency=LatencyDistribution(LatencyKind.UNIFORM, low=0.0, high=0.001),
+            responder=lambda prompt: '{"echo": "' + prompt + '"}',
+            rate_limit_rate=0.2, error_rate=0.2, partial_rate=0.2, seed=7,
+        )
+
+    first, second = _client(), _client()
+    assert outcomes(first, 50) == outcomes(second, 50)
+    assert first.stats.to_dict() == second.stats.to_dict()
+    assert first.stats.rate_limited and first.stats.errors and first.stats.partial_responses
+
+
+def test_quota_rejects_with_429():
+    client = FakeLLMClient(max_requests_per_second=3)
+    results = outcomes(client, 5)
+
+    assert all(isinstance(text, str) for text in results[:3])
+    assert results[3:] == [429, 429]
+    assert client.stats.successes == 3
+    assert client.stats.rate_limited == 2
+
+
+def test_rejected_prompt_tokens_are_not_billed():
+    client = FakeLLMClient(error_rate=1.0, seed=1)
+    prompt = "x" * 400
+
+    with pytest.raises(FakeLLMError) as error:
+        client.models.generate_content(model="fake", contents=prompt)
+    assert error.value.code in [500, 503]
+
+    assert client.stats.prompt_tokens == 0
+    assert client.stats.total_tokens == 0
+    assert client.stats.rejected_prompt_tokens == estimate_tokens(prompt)
+
+    client.error_rate = 0.0
+    response = client.models.generate_content(model="fake", contents=prompt)
+    assert client.stats.prompt_tokens == estimate_tokens(prompt)
+    assert response.usage_metadata.prompt_token_count == estimate_tokens(prompt)
+    assert client.stats.rejected_prompt_tokens == estimate_tokens(prompt)
@@ -0,0 +1,66 @@
+from src.llm_client import FakeLLMError, LoadHarness, ReviewJob
+from src.llm_client.load_harness import percentile
+
+VALID_RESPONSE = '{"state": "STOP"}'
+
+
+class ScriptedJob(ReviewJob):
+    '''
+    Raise (or return) the scripted outcomes in order, then return a valid response
+    '''
+
+    def __init__(self, outcomes: list):
+        self.name = "scripted"
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def execute(self, client) -> str:
+        self.calls += 1
+        if not self.outcomes:
+            return VALID_RESPONSE
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def run(outcomes: list, max_retries: int = 3):
+    job = ScriptedJob(outcomes)
+    harness = LoadHarness(client=None, max_retries=max_retries, backoff=0.0)
+    return job, harness._run_job(job)
+
+
+def test_percentile_nearest_rank():
+    values = [15, 20, 35, 40, 50]
+    assert percentile(values, 5) == 15
+    assert percentile(values, 30) == 20
+    assert percentile(values, 40) == 20
+    assert percentile(values, 50) == 35
+    assert percentile(values, 100) == 50
+    assert percentile([], 50) == 0.0
+
+
+def test_retries_rate_limits_server_errors_and_bad_json():
+    job, result = run([FakeLLMError(429, "quota"), FakeLLMError(503, "down"), "not json"])
+    assert result.success
+    assert result.retries == 3
+    assert job.calls == 4
+
+
+def test_does_not_retry_other_errors():
+    job, result = run([FakeLLMError(400, "bad request")])
+    assert not result.success
+    assert result.retries == 0
+    assert job.calls == 1
+
+    job, result = run([RuntimeError("boom")])
+    assert not result.success
+    assert job.calls == 1
+
+
+def test_gives_up_after_max_retries():
+    job, result = run([FakeLLMError(429, "quota")] * 10, max_retries=2)
+    assert not result.success
+    assert result.retries == 2
+    assert job.calls == 3
+    assert "429" in result.error